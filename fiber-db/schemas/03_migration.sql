@@ -0,0 +1,9 @@
+-- Test Polling Indexes: node_id lookups on metrics
+
+-- (node_id, time DESC) lookups are already served by idx_metrics_node_time (01_schema.sql).
+-- That btree only helps equality under a non-C collation, so prefix filters such as
+-- node_id LIKE 'probe-burst-%' still scan every chunk. The pattern_ops index below lets
+-- LIKE 'prefix%' use an index range scan; created on the hypertable so TimescaleDB
+-- propagates it to all existing and future chunks.
+CREATE INDEX IF NOT EXISTS idx_metrics_node_id_pattern
+ON metrics (node_id varchar_pattern_ops, time DESC);
@@ -43,6 +43,7 @@ NODE_CACHE_REFRESH_SEC = 3600
 USE_COPY = os.getenv("ETL_USE_COPY", "true").lower() == "true"
 DEDUP_ENABLED = os.getenv("ETL_DEDUP_ENABLED", "true").lower() == "true"
 NODE_CACHE_ENABLED = os.getenv("ETL_NODE_CACHE_ENABLED", "true").lower() == "true"
+NOTIFY_ENABLED = os.getenv("ETL_NOTIFY_ENABLED", "true").lower() == "true"
 
 from .metrics import ETLMetrics
 from datetime import timezone
@@ -320,6 +321,18 @@ async def process_batch(redis_client, db_pool, batch_pop_script, alert_engine=No
                      for _ in cleaned_metrics:
                         etl_metrics.record_row(success=False)
 
+            # 7b. NOTIFY metrics_inserted once per node (delivered on commit) so
+            # listeners can wait on inserts instead of polling
+            if NOTIFY_ENABLED and processed_count:
+                try:
+                    async with conn.transaction():  # Savepoint: a failed notify must not abort the batch
+                        await conn.execute(
+                            "SELECT pg_notify('metrics_inserted', node_id) FROM unnest($1::text[]) AS node_id",
+                            list({m['node_id'] for m in cleaned_metrics})
+                        )
+                except Exception as e:
+                    logger.warning(f"metrics_inserted notify failed: {e}")
+
     etl_metrics.set_active_probes(len({m['node_id'] for m in cleaned_metrics}))
     
     # 8. Logs & Status
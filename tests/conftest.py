@@ -1,17 +1,10 @@
 import pytest
+import pytest_asyncio
 import os
-import asyncio
 from tests.utils.http_client import TestHttpClient
 from tests.utils.sandbox_loader import SandboxLoader
 from tests.utils.db_helpers import DbAssertionHelper
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
 # Mark slow tests
 def pytest_configure(config):
     config.addinivalue_line("markers", "e2e: end-to-end tests (require sandbox)")
@@ -20,12 +13,24 @@ def pytest_configure(config):
 
 @pytest.fixture(scope="session")
 def client():
-    return TestHttpClient()
+    with TestHttpClient() as http:
+        yield http
 
 @pytest.fixture(scope="session")
 def sandbox():
     return SandboxLoader().load("dev")
 
+@pytest.fixture(scope="session")
+def container_endpoints():
+    """Container IPs from one docker inspect per session; docker_helpers use them if ports aren't mapped."""
+    # Imported here so collecting tests that don't use it doesn't need psycopg2/redis
+    from tests.utils.docker_helpers import (
+        DB_CONTAINER, REDIS_CONTAINER, resolve_endpoints, use_container_endpoints
+    )
+    endpoints = resolve_endpoints([DB_CONTAINER, REDIS_CONTAINER])
+    use_container_endpoints(endpoints)
+    return endpoints
+
 @pytest.fixture(scope="session")
 def api_url():
     host = os.getenv("API_HOST", "localhost")
@@ -37,32 +42,53 @@ def federation_secret():
     return os.getenv("FEDERATION_SECRET", "sandbox_secret")
 
 
-@pytest.fixture(scope="session")
-def db_helper():
+@pytest_asyncio.fixture(scope="module")
+async def db_helper():
+    """DB assertion helper backed by an asyncpg pool shared across the module."""
     db_user = os.getenv("DB_USER", "postgres")
     db_pass = os.getenv("DB_PASS", "postgres")
     db_host = os.getenv("DB_HOST", "localhost")
     db_name = os.getenv("DB_NAME", "fiberstack")
     dsn = f"postgresql://{db_user}:{db_pass}@{db_host}:5432/{db_name}"
-    return DbAssertionHelper(dsn)
+    helper = DbAssertionHelper(dsn)
+    await helper.init()
+    yield helper
+    await helper.aclose()
 
 import httpx
 
-@pytest.fixture
-async def probe_token(api_url):
-    """Get a valid JWT token for probe operations."""
-    async with httpx.AsyncClient() as client:
-        # Based on docker-compose USER_CREDENTIALS=...probe_user:probe_password
-        response = await client.post(f"{api_url}/auth/login", json={
-            "username": "probe_user",
-            "password": "probe_password"
+@pytest_asyncio.fixture(scope="module")
+async def http_client(api_url):
+    """One keep-alive connection pool (base_url=api_url) shared by every test in the module."""
+    async with httpx.AsyncClient(
+        base_url=api_url,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=10.0
+    ) as client:
+        yield client
+
+@pytest_asyncio.fixture(scope="module")
+async def grafana_client():
+    """One GrafanaClient (and connection pool) shared by every test in the module."""
+    # Imported here so collecting tests that don't use it doesn't need orjson/h2
+    from tests.utils.grafana_client import GrafanaClient
+    async with GrafanaClient(os.getenv("GRAFANA_URL", "http://localhost:3000")) as client:
+        yield client
+
+@pytest_asyncio.fixture(scope="module")
+async def probe_token(http_client):
+    """Get a valid JWT token for probe operations (logged in once per module)."""
+    # Based on docker-compose USER_CREDENTIALS=...probe_user:probe_password
+    response = await http_client.post("/auth/login", json={
+        "username": "probe_user",
+        "password": "probe_password"
+    })
+    if response.status_code != 200:
+        # Fallback to admin if probe_user doesn't exist
+        response = await http_client.post("/auth/login", json={
+            "username": "admin",
+            "password": "admin"
         })
-        if response.status_code != 200:
-            # Fallback to admin if probe_user doesn't exist
-            response = await client.post(f"{api_url}/auth/login", json={
-                "username": "admin",
-                "password": "admin"
-            })
-        if response.status_code == 200:
-             return response.json()["access_token"]
-        return "mock_token" # Fallback to avoid complete crash if auth fails
+    if response.status_code == 200:
+         return response.json()["access_token"]
+    return "mock_token" # Fallback to avoid complete crash if auth fails
@@ -71,7 +71,6 @@ def run_docker_command(cmd_list):
         return False
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
 class TestMultiClusterScale:
     """A. Scalability & Consistency (1000 Probes)"""
 
@@ -112,7 +111,6 @@ class TestMultiClusterScale:
             assert success_count >= 450, f"Expected >= 450 successes, got {success_count}"
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
 class TestRateLimitChaos:
     """B. Rate Limiting Resilience"""
 
@@ -247,7 +245,6 @@ class TestRateLimitChaos:
             await asyncio.sleep(5) # Wait for startup
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
 class TestObservability:
     """C. Logging & Observability"""
 
@@ -1,19 +1,22 @@
-import pytest
 import pytest_asyncio
 import asyncio
 import sys
 import os
+import aiohttp
 from aiohttp import web
 from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+from yarl import URL
 
 # Add fiber-probe/src to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../fiber-probe/src')))
 
 from client import FederationClient
 
-# Mock API Handlers
-fail_counter = {} # node_id -> current failures
+# Mocked-transport target (no real server behind it)
+MOCK_URL = "http://federation.test/ingest"
 
+# Mock API Handlers
 async def mock_api_handler(request):
     auth = request.headers.get("Authorization")
     if auth != "Bearer secret":
@@ -22,15 +25,6 @@ async def mock_api_handler(request):
     batch_id = request.headers.get("X-Batch-ID")
     if not batch_id:
         return web.Response(status=400)
-    
-    # Flaky Simulation via Header
-    node_id = (await request.json()).get("node_id")
-    if node_id == "flaky-node":
-        global fail_counter
-        count = fail_counter.get(batch_id, 0)
-        if count < 2: # Fail twice
-            fail_counter[batch_id] = count + 1
-            return web.Response(status=500)
         
     return web.json_response({"status": "accepted"}, status=202)
 
@@ -47,8 +41,13 @@ async def api_server():
     # Stop server
     await server.close()
 
-@pytest.mark.asyncio
-async def test_federation_client_success(api_server):
+@pytest_asyncio.fixture(scope="module")
+async def http_session():
+    """Single client session shared by the federation client tests (module loop, see pytest.ini)."""
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10)) as session:
+        yield session
+
+async def test_federation_client_success(api_server, http_session):
     config = {
         "url": str(api_server.make_url('/ingest')),
         "auth": {"type": "bearer", "token_env": "TEST_TOKEN"},
@@ -58,54 +57,53 @@ async def test_federation_client_success(api_server):
     os.environ["TEST_TOKEN"] = "secret"
     client = FederationClient("test-target", config)
     
-    # Use client session
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
-        success = await client.push_batch(
-            session, 
-            [{"latency": 10}], 
-            "node-1"
-        )
-        assert success is True
+    success = await client.push_batch(
+        http_session, 
+        [{"latency": 10}], 
+        "node-1"
+    )
+    assert success is True
 
-@pytest.mark.asyncio
-async def test_federation_client_auth_fail(api_server):
+async def test_federation_client_auth_fail(http_session):
     config = {
-        "url": str(api_server.make_url('/ingest')),
+        "url": MOCK_URL,
         "auth": {"type": "bearer", "token_env": "WRONG_TOKEN"},
     }
     
     os.environ["WRONG_TOKEN"] = "wrong"
     client = FederationClient("test-target", config)
     
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
+    with aioresponses() as m:
+        m.post(MOCK_URL, status=401)
         success = await client.push_batch(
-            session, 
+            http_session, 
             [{"latency": 10}], 
             "node-1"
         )
         assert success is False
+        # 4xx is unrecoverable: no retry
+        assert len(m.requests[("POST", URL(MOCK_URL))]) == 1
 
-@pytest.mark.asyncio
-async def test_federation_client_retry_success(api_server):
+async def test_federation_client_retry_success(http_session):
     config = {
-        "url": str(api_server.make_url('/ingest')),
+        "url": MOCK_URL,
         "auth": {"type": "bearer", "token_env": "TEST_TOKEN"},
-        # Fast retry for test
-        "retry": {"max_attempts": 3, "base_delay_ms": 10} 
+        # No backoff wait: responses are pre-programmed
+        "retry": {"max_attempts": 3, "base_delay_ms": 0} 
     }
     
-    import os
     os.environ["TEST_TOKEN"] = "secret"
     client = FederationClient("test-target", config)
     
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
+    with aioresponses() as m:
+        m.post(MOCK_URL, status=500)
+        m.post(MOCK_URL, status=500)
+        m.post(MOCK_URL, status=202, payload={"status": "accepted"})
         # Should succeed after 2 failures (3rd attempt)
         success = await client.push_batch(
-            session, 
+            http_session, 
             [{"latency": 10}], 
             "flaky-node"
         )
         assert success is True
+        assert len(m.requests[("POST", URL(MOCK_URL))]) == 3
@@ -1,44 +1,36 @@
-from locust import HttpUser, task, between
-import uuid
+from locust import task, between
+from locust.contrib.fasthttp import FastHttpUser
+import os
 import random
-from datetime import datetime, timezone
-import requests
-from gevent.lock import BoundedSemaphore
+import sys
+import orjson
 
-SHARED_TOKEN = None
-TOKEN_LOCK = BoundedSemaphore()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from tests.utils.time_helpers import iso_now
 
-class FiberUser(HttpUser):
+# Bearer token handed in via env (the API accepts the federation secret), so users never log in
+FEDERATION_SECRET = os.getenv("FEDERATION_SECRET", "sandbox_secret")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_LOSS = (0.0, 0.1, 1.5)
+
+
+class FiberUser(FastHttpUser):
     wait_time = between(0.01, 0.1)  # High throughput
+    network_timeout = 10
+    connection_timeout = 10
+    default_headers = {"Authorization": f"Bearer {FEDERATION_SECRET}"}
 
     def on_start(self):
-        global SHARED_TOKEN
-        if not SHARED_TOKEN:
-            with TOKEN_LOCK:
-                if not SHARED_TOKEN:
-                    try:
-                        resp = self.client.post("/api/auth/login", json={"username": "admin", "password": "admin"})
-                        if resp.status_code == 200:
-                            SHARED_TOKEN = resp.json()["access_token"]
-                            print("Logged in successfully (Singleton)")
-                        else:
-                            print(f"Login Failed: {resp.status_code}")
-                    except Exception as e:
-                        print(f"Login Error: {e}")
-        
-        if SHARED_TOKEN:
-            self.client.headers.update({"Authorization": f"Bearer {SHARED_TOKEN}"})
+        # Per-user payload template: only the varying fields are rewritten per request
+        self._payload = {"region": "LoadTest", "country": "US", "uptime_pct": 99.9}
+        self._rand = random.Random()
 
     @task
     def push_metric(self):
-        node_id = f"load-{uuid.uuid4().hex[:8]}"
-        payload = {
-            "node_id": node_id,
-            "region": "LoadTest",
-            "country": "US",
-            "latency_ms": random.uniform(10, 500),
-            "packet_loss": random.choice([0.0, 0.1, 1.5]),
-            "uptime_pct": 99.9,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        self.client.post("/api/push", json=payload)
+        payload = self._payload
+        payload["node_id"] = f"load-{self._rand.getrandbits(32):08x}"
+        payload["latency_ms"] = self._rand.uniform(10, 500)
+        payload["packet_loss"] = self._rand.choice(_LOSS)
+        payload["timestamp"] = iso_now()
+        self.client.post("/api/push", data=orjson.dumps(payload), headers=_JSON_HEADERS)
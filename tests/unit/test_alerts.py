@@ -30,7 +30,6 @@ def engine(redis_mock):
     dispatcher = MockDispatcher()
     return AlertEngine(redis_mock, dispatcher), dispatcher, redis_mock
 
-@pytest.mark.asyncio
 async def test_alert_latency_critical(engine):
     eng, disp, redis = engine
     
@@ -58,7 +57,6 @@ async def test_alert_latency_critical(engine):
     calls = [call[0][0] for call in redis.set.call_args_list]
     assert key in calls
 
-@pytest.mark.asyncio
 async def test_alert_deduplication(engine):
     eng, disp, redis = engine
     
@@ -76,7 +74,6 @@ async def test_alert_deduplication(engine):
     # Should still satisfy assert len == 1 (no new dispatch)
     assert len(disp.dispatched) == 1
 
-@pytest.mark.asyncio
 async def test_no_alert_healthy(engine):
     eng, disp, _ = engine
     metric = {"node_id": "healthy", "latency_ms": 50.0, "packet_loss": 0.0, "uptime_pct": 100.0}
@@ -8,8 +8,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../f
 
 from analytics import AnalyticsEngine, ComputedMetric
 
-@pytest.fixture
-def redis_mock():
+@pytest.fixture(scope="module")
+def _mock_skeleton():
+    """Build the Redis client + pipeline mock graph once per module."""
     mock = AsyncMock()
     
     # 1. The pipeline object itself (Synchronous methods)
@@ -34,13 +35,20 @@ def redis_mock():
     # 5. client.pipeline() is a SYNC call returning the pipeline
     mock.pipeline = MagicMock(return_value=pipeline)
     
+    return mock, pipeline
+
+@pytest.fixture
+def redis_mock(_mock_skeleton):
+    mock, pipeline = _mock_skeleton
+    # Only per-test state is reset; the mock graph is reused
+    pipeline.execute.reset_mock()
+    pipeline.execute.return_value = None
     return mock
 
 @pytest.fixture
 def engine(redis_mock):
     return AnalyticsEngine(redis_mock), redis_mock
 
-@pytest.mark.asyncio
 async def test_insufficient_data(engine):
     eng, redis = engine
     # Access the pipeline object returned by mock.pipeline()
@@ -53,7 +61,6 @@ async def test_insufficient_data(engine):
     assert cm.anomaly_score == 0.0
     assert cm.latency_avg_window is None
 
-@pytest.mark.asyncio
 async def test_normal_flow(engine):
     eng, redis = engine
     pipeline = redis.pipeline.return_value
@@ -66,7 +73,6 @@ async def test_normal_flow(engine):
     assert cm.latency_avg_window == 10.5
     assert cm.anomaly_score == 0.0
 
-@pytest.mark.asyncio
 async def test_high_spike(engine):
     eng, redis = engine
     pipeline = redis.pipeline.return_value
@@ -84,7 +90,6 @@ async def test_high_spike(engine):
     assert cm.anomaly_score > 0.5
     assert cm.anomaly_score <= 1.0
 
-@pytest.mark.asyncio
 async def test_loss_spike(engine):
     eng, redis = engine
     pipeline = redis.pipeline.return_value
@@ -1,42 +1,83 @@
 """E2E Test API Helpers."""
+import atexit
 import os
-import requests
+import httpx
+import orjson
+import secrets
 import uuid
-import json
-from datetime import datetime, timezone
 from typing import List, Dict, Optional
+from tests.utils.time_helpers import iso_now
 
 API_HOST = os.getenv("API_HOST", "localhost")
 API_URL = f"http://{API_HOST}:8000/api"
 FEDERATION_SECRET = os.getenv("FEDERATION_SECRET", "sandbox_secret")
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
+# Shared keep-alive client: helpers reuse pooled connections instead of a new TCP setup per call
+_CLIENT = httpx.Client(
+    base_url=API_URL,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+atexit.register(_CLIENT.close)
 
-def push_single_metric(
+
+def rand_id(prefix: str, nbytes: int = 4) -> str:
+    """Short unique test identifier, e.g. rand_id("node") -> "node-1a2b3c4d"."""
+    return f"{prefix}-{secrets.token_hex(nbytes)}"
+
+
+def _metric_payload(
     node_id: str,
-    latency_ms: float = 50.0,
-    packet_loss: float = 0.0,
-    uptime_pct: float = 100.0,
-    country: str = "US",
-    region: str = "Test"
-) -> requests.Response:
-    """Push a single metric via legacy /push endpoint."""
-    payload = {
+    latency_ms: float,
+    packet_loss: float,
+    uptime_pct: float,
+    country: str,
+    region: str
+) -> Dict:
+    return {
         "node_id": node_id,
         "country": country,
         "region": region,
         "latency_ms": latency_ms,
         "uptime_pct": uptime_pct,
         "packet_loss": packet_loss,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": iso_now()
     }
-    return requests.post(f"{API_URL}/push", json=payload)
+
+
+def push_single_metric(
+    node_id: str,
+    latency_ms: float = 50.0,
+    packet_loss: float = 0.0,
+    uptime_pct: float = 100.0,
+    country: str = "US",
+    region: str = "Test"
+) -> httpx.Response:
+    """Push a single metric via legacy /push endpoint."""
+    payload = _metric_payload(node_id, latency_ms, packet_loss, uptime_pct, country, region)
+    return _CLIENT.post("/push", content=orjson.dumps(payload), headers=_JSON_HEADERS)
+
+
+async def push_single_metric_async(
+    client: httpx.AsyncClient,
+    node_id: str,
+    latency_ms: float = 50.0,
+    packet_loss: float = 0.0,
+    uptime_pct: float = 100.0,
+    country: str = "US",
+    region: str = "Test"
+) -> httpx.Response:
+    """Async push_single_metric; client must be created with base_url=API_URL."""
+    payload = _metric_payload(node_id, latency_ms, packet_loss, uptime_pct, country, region)
+    return await client.post("/push", content=orjson.dumps(payload), headers=_JSON_HEADERS)
 
 
 def push_batch_metrics(
     node_id: str,
     metrics: List[Dict],
     batch_id: Optional[str] = None
-) -> requests.Response:
+) -> httpx.Response:
     """Push a batch of metrics via /ingest (federation) endpoint."""
     batch_id = batch_id or str(uuid.uuid4())
     payload = {
@@ -48,14 +89,14 @@ def push_batch_metrics(
         "X-Batch-ID": batch_id,
         "Content-Type": "application/json"
     }
-    return requests.post(f"{API_URL}/ingest", json=payload, headers=headers)
+    return _CLIENT.post("/ingest", content=orjson.dumps(payload), headers=headers)
 
 
-def get_aggregated_metrics(dimension: str = "region") -> requests.Response:
+def get_aggregated_metrics(dimension: str = "region") -> httpx.Response:
     """Fetch aggregated metrics."""
-    return requests.get(f"{API_URL}/metrics/aggregated", params={"dimension": dimension})
+    return _CLIENT.get("/metrics/aggregated", params={"dimension": dimension})
 
 
-def get_api_status() -> requests.Response:
+def get_api_status() -> httpx.Response:
     """Get API/ETL status."""
-    return requests.get(f"{API_URL}/status")
+    return _CLIENT.get("/status")
@@ -1,31 +1,67 @@
 import asyncpg
 import asyncio
+import random
+
+# Constant, parameterized SQL: asyncpg caches the prepared statement per pooled connection
+_COUNT_BY_NODE = "SELECT COUNT(*) FROM metrics WHERE node_id = $1"
+_COUNT_BY_NODE_PREFIX = "SELECT COUNT(*) FROM metrics WHERE node_id LIKE $1"
+_COUNT_NODES_WITH_METRICS = "SELECT COUNT(DISTINCT node_id) FROM metrics WHERE node_id = ANY($1::text[])"
+
+def _like_prefix(prefix):
+    """Escape LIKE wildcards in prefix and append '%'."""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
 
 class DbAssertionHelper:
     def __init__(self, dsn):
         self.dsn = dsn
+        self.pool = None
+
+    async def init(self):
+        self.pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=5)
+
+    async def aclose(self):
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
 
     async def get_count(self, table, condition=None):
-        conn = await asyncpg.connect(self.dsn)
-        try:
-            query = f"SELECT COUNT(*) FROM {table}"
-            if condition:
-                query += f" WHERE {condition}"
+        query = f"SELECT COUNT(*) FROM {table}"
+        if condition:
+            query += f" WHERE {condition}"
+        async with self.pool.acquire() as conn:
             return await conn.fetchval(query)
-        finally:
-            await conn.close()
 
-    async def wait_for_data(self, table, condition=None, min_count=1, timeout=30):
-        for _ in range(timeout):
-            count = await self.get_count(table, condition)
+    async def count_metrics_by_node(self, node_id):
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(_COUNT_BY_NODE, node_id)
+
+    async def count_metrics_by_node_prefix(self, prefix):
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(_COUNT_BY_NODE_PREFIX, _like_prefix(prefix))
+
+    async def count_nodes_with_metrics(self, node_ids):
+        """Number of the given node_ids that have at least one metrics row."""
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(_COUNT_NODES_WITH_METRICS, list(node_ids))
+
+    async def wait_for_count(self, count_fn, *args, min_count=1, timeout=30, what=None):
+        """Poll count_fn(*args) until it reaches min_count (backoff 100ms -> 1s, with jitter)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.1
+        while True:
+            count = await count_fn(*args)
             if count >= min_count:
                 return count
-            await asyncio.sleep(1)
-        raise AssertionError(f"Timeout waiting for data in {table} (current: {await self.get_count(table, condition)})")
+            if loop.time() >= deadline:
+                break
+            await asyncio.sleep(min(delay + random.uniform(0, delay * 0.1), deadline - loop.time()))
+            delay = min(delay * 2, 1.0)
+        raise AssertionError(f"Timeout waiting for data in {what or count_fn.__name__} (current: {count})")
+
+    async def wait_for_data(self, table, condition=None, min_count=1, timeout=30):
+        return await self.wait_for_count(self.get_count, table, condition, min_count=min_count, timeout=timeout, what=table)
 
     async def get_node_status(self, node_id):
-        conn = await asyncpg.connect(self.dsn)
-        try:
+        async with self.pool.acquire() as conn:
             return await conn.fetchval("SELECT status FROM nodes WHERE node_id = $1", node_id)
-        finally:
-            await conn.close()
@@ -1,59 +1,583 @@
+import asyncio
+import atexit
+import json
+import os
+import re
+import select
+import shlex
+import shutil
+import socket
 import subprocess
+import threading
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
-def verify_db_record_exists(node_id: str, container_name="fiber-db", retries=10, delay=1) -> bool:
+import psycopg2
+import psycopg2.errors
+import psycopg2.pool
+import redis
+
+DB_USER = os.getenv("DB_USER", "postgres")
+DB_NAME = os.getenv("DB_NAME", "fiberstack")
+
+
+def _dsn(host: str) -> str:
+    # connect_timeout bounds each poll (and the pool's first connect) when the host is unreachable
+    return (
+        f"postgresql://{DB_USER}:{os.getenv('DB_PASS', 'postgres')}@{host}:5432/{DB_NAME}"
+        "?connect_timeout=1"
+    )
+
+
+DB_DSN = _dsn(os.getenv("DB_HOST", "localhost"))
+DB_CONTAINER = os.getenv("DB_CONTAINER", "fiber-db")
+REDIS_CONTAINER = os.getenv("REDIS_CONTAINER", "dev-fiber-redis-1")
+# Server-side prepared statements: parsed and planned once per pooled connection
+_PREPARED = {
+    "record_exists": "PREPARE record_exists(text) AS "
+                     "SELECT EXISTS(SELECT 1 FROM metrics WHERE node_id = $1)",
+    "records_exist": "PREPARE records_exist(text[]) AS "
+                     "SELECT DISTINCT node_id FROM metrics WHERE node_id = ANY($1)",
+}
+# ETL sends NOTIFY metrics_inserted, '<node_id>' when a batch commits (ETL_NOTIFY_ENABLED)
+_INSERT_CHANNEL = "metrics_inserted"
+# Host port of the sandbox Redis (sandbox/dev/docker-compose.sandbox.yml); not 6379, so an
+# unrelated local Redis or the fiber-deploy stack is never read by mistake
+SANDBOX_REDIS_PORT = 16379
+# redis://host:port/db, or unix:///path/redis.sock?db=0 for a socket mounted out of the container
+REDIS_URL = os.getenv("REDIS_URL", f"redis://localhost:{SANDBOX_REDIS_PORT}/0")
+# When Redis isn't reachable at REDIS_URL, fall back to redis-cli via docker exec (set "false" to disable)
+REDIS_EXEC_FALLBACK = os.getenv("REDIS_EXEC_FALLBACK", "true").lower() == "true"
+
+# Created on first use (not at import) so modules that never touch the DB don't need it up;
+# the lock covers first use from several worker threads (the *_async helpers)
+_DB_POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_INIT_LOCK = threading.Lock()
+
+
+def _db_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    global _DB_POOL
+    with _INIT_LOCK:
+        if _DB_POOL is None:
+            _DB_POOL = psycopg2.pool.ThreadedConnectionPool(1, 8, DB_DSN)
+            atexit.register(_DB_POOL.closeall)
+    return _DB_POOL
+
+
+@contextmanager
+def _db_conn():
+    """
+    Borrow an autocommit connection from the pool. It always goes back; if the block raised
+    (DB error, interrupt mid-LISTEN, ...) its state is unknown, so it is closed, not reused.
     """
-    Verifies a metrics record exists in the DB container via docker exec.
+    pool = _db_pool()
+    conn = pool.getconn()
+    broken = True
+    try:
+        conn.autocommit = True
+        yield conn
+        broken = False
+    finally:
+        pool.putconn(conn, close=broken or conn.closed != 0)
+
+
+def _execute_prepared(cur, name: str, param) -> None:
+    """EXECUTE a statement from _PREPARED, preparing it on first use on this connection."""
+    try:
+        cur.execute(f"EXECUTE {name}(%s)", (param,))
+    except psycopg2.errors.InvalidSqlStatementName:
+        # Autocommit, so the failed EXECUTE leaves no aborted transaction behind
+        cur.execute(_PREPARED[name])
+        cur.execute(f"EXECUTE {name}(%s)", (param,))
+
+
+_REDIS: Optional[redis.Redis] = None
+
+
+def _redis() -> redis.Redis:
+    global _REDIS
+    with _INIT_LOCK:
+        if _REDIS is None:
+            pool = redis.ConnectionPool.from_url(
+                REDIS_URL, max_connections=16, decode_responses=True, socket_connect_timeout=1
+            )
+            _REDIS = redis.Redis(connection_pool=pool)
+            atexit.register(pool.disconnect)
+    return _REDIS
+
+
+# Missing container / unreachable daemon: retrying can't help
+# (not "Connection refused": psql / redis-cli print that while the service is still starting)
+_FATAL_DOCKER_ERRORS = ("No such container", "No such object", "Cannot connect to the Docker daemon")
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Errors worth retrying (service still starting, network blip); anything else fails fast."""
+    return isinstance(exc, (
+        ConnectionError, TimeoutError, subprocess.TimeoutExpired,
+        psycopg2.OperationalError, psycopg2.pool.PoolError,
+        redis.ConnectionError, redis.TimeoutError
+    ))
+
+
+def _raise_if_fatal_docker_error(name: str, stderr: str) -> None:
+    """Raise RuntimeError for docker CLI errors that mean the setup is broken, not slow."""
+    if any(marker in stderr for marker in _FATAL_DOCKER_ERRORS):
+        raise RuntimeError(f"docker: container {name!r} unavailable: {stderr.strip()}")
+
+
+def _check_container(name: str) -> None:
+    """After a failed docker call: raise if the container is missing or docker is down."""
+    res = subprocess.run(
+        ["docker", "inspect", "--type", "container", "--format", "{{.Id}}", name],
+        capture_output=True, text=True
+    )
+    if res.returncode != 0:
+        _raise_if_fatal_docker_error(name, res.stderr)
+
+
+# ETL log lines are "<asctime> [LEVEL] fiber-etl: {json}": strip the prefix, parse, and emit the
+# node_id of every alert (top-level or under "alert") with severity $sev whose id is in $ids
+_JQ = shutil.which("jq")
+_JQ_ALERT_IDS = (
+    'sub("^[^{]*"; "") | fromjson? | select(type == "object") | (.alert // .)'
+    ' | select(type == "object" and .severity == $sev) | .node_id'
+    ' | select(. as $n | any($ids[]; . == $n))'
+)
+
+# severity -> pattern capturing the node_id of an alert with that severity (same JSON object)
+_ALERT_RE_CACHE: Dict[str, "re.Pattern[str]"] = {}
+
+
+def _alert_pattern(severity: str) -> "re.Pattern[str]":
+    pattern = _ALERT_RE_CACHE.get(severity)
+    if pattern is None:
+        pattern = _ALERT_RE_CACHE[severity] = re.compile(
+            rf'\{{[^{{}}]*"node_id":\s*"([^"]*)"[^{{}}]*"severity":\s*"{re.escape(severity)}"'
+        )
+    return pattern
+
+
+_START = b"\x1eSTART\x1e"
+_END_RE = re.compile(rb"\x1eEND(\d+)\x1e")
+
+
+class _ShellChannel:
+    """
+    One long-lived `docker exec -i <container> sh`; commands are written to its stdin and
+    their output is framed by start/end markers, so each call skips docker CLI startup.
+    """
+
+    def __init__(self, container: str):
+        self.container = container
+        self._proc = subprocess.Popen(
+            ["docker", "exec", "-i", container, "sh"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(self, cmd: str, timeout: float = 10.0) -> Tuple[int, str]:
+        """Run a shell command in the container, returning (exit code, combined output)."""
+        with self._lock:
+            try:
+                self._proc.stdin.write(
+                    f"printf '\\036START\\036'; {cmd}; printf '\\036END%s\\036' \"$?\"\n".encode()
+                )
+            except BrokenPipeError:
+                # docker exec already exited, e.g. "No such container"; keep its message
+                out = self._proc.stdout.read().decode(errors="replace").strip()
+                raise RuntimeError(f"{self.container}: shell channel closed: {out}") from None
+            fd = self._proc.stdout.fileno()
+            deadline = time.monotonic() + timeout
+            buf = b""
+            while True:
+                m = _END_RE.search(buf)
+                if m:
+                    out = buf[buf.index(_START) + len(_START):m.start()]
+                    return int(m.group(1)), out.decode(errors="replace")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    self.close()
+                    raise TimeoutError(f"{self.container}: no reply to {cmd!r} within {timeout}s")
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    # docker exec exited, e.g. "No such container"; keep its message
+                    raise RuntimeError(f"{self.container}: shell channel closed: {buf.decode(errors='replace').strip()}")
+                buf += chunk
+
+    def close(self):
+        if self.alive:
+            self._proc.kill()
+        self._proc.wait()
+
+
+_CHANNELS: Dict[str, _ShellChannel] = {}
+
+
+def _channel(container: str) -> _ShellChannel:
+    """Cached shell channel per container; respawned if the previous one died."""
+    ch = _CHANNELS.get(container)
+    if ch is None or not ch.alive:
+        ch = _CHANNELS[container] = _ShellChannel(container)
+    return ch
+
+
+@atexit.register
+def _close_channels():
+    for ch in _CHANNELS.values():
+        ch.close()
+
+
+def resolve_endpoints(names: Iterable[str]) -> Dict[str, str]:
+    """Container name -> IP address, from a single `docker inspect` over all names ({} without docker)."""
+    fmt = "{{.Name}} {{range .NetworkSettings.Networks}}{{.IPAddress}} {{end}}"
+    try:
+        # Exits non-zero if any name is missing but still prints the ones it found
+        out = subprocess.run(["docker", "inspect", "--format", fmt, *names], capture_output=True, text=True).stdout
+    except Exception:
+        return {}
+    endpoints = {}
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            endpoints[parts[0].lstrip("/")] = parts[1]
+    return endpoints
+
+
+def _port_open(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def use_container_endpoints(endpoints: Dict[str, str]) -> None:
+    """
+    Point the pooled DB/Redis clients at container IPs from resolve_endpoints when the
+    localhost port isn't mapped but the IP is reachable (bridge IPs aren't on Docker Desktop),
+    instead of falling back to docker exec per call. Settings given explicitly via
+    DB_HOST / REDIS_URL are left alone; call before first use.
+    """
+    global DB_DSN, REDIS_URL
+    db_ip = endpoints.get(DB_CONTAINER)
+    if (db_ip and "DB_HOST" not in os.environ
+            and not _port_open("localhost", 5432) and _port_open(db_ip, 5432)):
+        DB_DSN = _dsn(db_ip)
+    redis_ip = endpoints.get(REDIS_CONTAINER)
+    if (redis_ip and "REDIS_URL" not in os.environ
+            and not _port_open("localhost", SANDBOX_REDIS_PORT) and _port_open(redis_ip, 6379)):
+        REDIS_URL = f"redis://{redis_ip}:6379/0"
+
+
+def wait_until(
+    predicate: Callable[[], bool],
+    timeout: float = 5.0,
+    interval: float = 0.05,
+    max_interval: Optional[float] = None
+) -> bool:
+    """
+    Poll predicate until it returns truthy or timeout (seconds) elapses.
+
+    With max_interval set, the interval doubles after each miss up to that cap, so a quick
+    hit returns within tens of ms while slow paths don't hammer the target.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        if max_interval is not None:
+            interval = min(interval * 2, max_interval)
+
+
+def _wait_for_node(conn, node_id: str, deadline: float) -> bool:
+    """
+    LISTEN for ETL insert notifications, then check EXISTS and block until a NOTIFY names
+    node_id; re-checks once a second in case the ETL isn't sending notifications.
+    """
+    with conn.cursor() as cur:
+        cur.execute(f"LISTEN {_INSERT_CHANNEL}")
+        try:
+            while True:
+                _execute_prepared(cur, "record_exists", node_id)
+                if cur.fetchone()[0]:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if select.select([conn], [], [], min(1.0, remaining))[0]:
+                    conn.poll()
+                    notified = any(n.payload == node_id for n in conn.notifies)
+                    conn.notifies.clear()
+                    if notified:
+                        return True
+        finally:
+            # Pooled connection goes back clean
+            cur.execute(f"UNLISTEN {_INSERT_CHANNEL}")
+            conn.notifies.clear()
+
+
+def _psql_exists(node_id: str, container: str, timeout: float = 5.0) -> bool:
+    """
+    EXISTS check via psql inside the DB container, for when the Postgres port isn't mapped.
+
+    -qtAX makes the output exactly "t" or "f". node_id goes in as a psql variable (:'node_id'
+    quotes it), so it is never spliced into SQL. A docker exec that doesn't answer within
+    timeout is killed and TimeoutExpired raised (transient, so the caller may retry).
+    """
+    proc = subprocess.Popen(
+        ["docker", "exec", "-i", container, "psql", "-qtAX", "-U", DB_USER, "-d", DB_NAME,
+         "-v", f"node_id={node_id}"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        out, err = proc.communicate(
+            b"SELECT EXISTS(SELECT 1 FROM metrics WHERE node_id = :'node_id');\n", timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    line = out.strip()
+    if not line:
+        # No answer: a missing container is fatal, psql errors (DB starting) are retried
+        _raise_if_fatal_docker_error(container, err.decode(errors="replace"))
+    return line == b"t"
+
+
+def _db_check(node_id: str, check: Callable, timeout: float = 5.0) -> bool:
+    """
+    Run check(conn) on a pooled connection, or ask psql in DB_CONTAINER (bounded by timeout)
+    when Postgres isn't reachable from the host. Transient errors count as "not yet"; others
+    are raised.
+    """
+    try:
+        try:
+            with _db_conn() as conn:
+                return check(conn)
+        except psycopg2.OperationalError:
+            # Port not mapped (or DB unreachable from the host): ask psql in the container
+            return _psql_exists(node_id, DB_CONTAINER, timeout)
+    except Exception as e:
+        if not _is_transient(e):
+            raise
+        return False
+
+
+def verify_db_record_exists(node_id: str, timeout: float = 10.0) -> bool:
+    """
+    Verifies a metrics record exists in the DB via a pooled connection (DB_* env vars).
+
+    Waits on the ETL's metrics_inserted notifications rather than polling; falls back to
+    psql in DB_CONTAINER when Postgres isn't reachable from the host.
     
     Args:
         node_id: The UUID to check for in the metrics table.
-        container_name: Name of the DB container (default: fiber-db).
-        retries: Number of retry attempts.
-        delay: Delay between retries in seconds.
-    """
-    cmd = [
-        "docker", "exec", container_name, 
-        "psql", "-U", "postgres", "-d", "fiberstack", 
-        "-t", "-c", 
-        f"SELECT count(*) FROM metrics WHERE node_id = '{node_id}';"
-    ]
-    
-    for _ in range(retries):
+        timeout: Overall deadline in seconds.
+    """
+    deadline = time.monotonic() + timeout
+
+    def _exists() -> bool:
+        return _db_check(
+            node_id, lambda conn: _wait_for_node(conn, node_id, deadline),
+            timeout=max(deadline - time.monotonic(), 0.1)
+        )
+
+    return wait_until(_exists, timeout=timeout, interval=0.05, max_interval=1.0)
+
+
+def verify_db_records_exist(node_ids: Iterable[str], timeout: float = 10.0) -> bool:
+    """
+    Batch verify_db_record_exists: one ANY(%s) query per poll covers every node_id still
+    missing, so K ids cost one round trip per poll instead of K.
+    """
+    pending = set(node_ids)
+
+    def _all_exist() -> bool:
+        if not pending:
+            return True
         try:
-            res = subprocess.run(cmd, capture_output=True, text=True)
-            if res.returncode == 0:
-                count = res.stdout.strip()
-                if count == "1":
-                    return True
-        except Exception:
-            # Ignoring transient errors during retry loop
-            pass
-        time.sleep(delay)
-    return False
+            with _db_conn() as conn, conn.cursor() as cur:
+                _execute_prepared(cur, "records_exist", list(pending))
+                pending.difference_update(row[0] for row in cur.fetchall())
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+        return not pending
+
+    return wait_until(_all_exist, timeout=timeout, interval=0.05, max_interval=1.0)
 
 
-def verify_alert_in_logs(node_id: str, severity: str = "warning", retries: int = 5) -> bool:
+def verify_alert_in_logs(
+    node_id: str,
+    severity: str = "warning",
+    container_name: str = "dev-fiber-etl-1",
+    timeout: float = 10.0
+) -> bool:
     """Check if an alert was fired in ETL logs."""
-    cmd = [
-        "docker", "logs", "dev-fiber-etl-1", "--tail", "200"
-    ]
-    for _ in range(retries):
+    return verify_alerts_in_logs([node_id], severity, container_name, timeout)
+
+
+def verify_alerts_in_logs(
+    node_ids: Iterable[str],
+    severity: str = "warning",
+    container_name: str = "dev-fiber-etl-1",
+    timeout: float = 10.0
+) -> bool:
+    """
+    Check that an alert of the given severity was logged for every node_id.
+
+    The first read covers the last 200 lines; later reads use `docker logs --since` so each
+    retry only fetches lines written since the previous one. Logs are piped through `jq`,
+    which parses each line and prints only the matching node_ids. Without jq, `grep -F`
+    passes lines naming a pending node and one cached regex matches node_id and severity
+    within the same JSON object.
+    """
+    return wait_until(
+        _alert_log_poller(node_ids, severity, container_name),
+        timeout=timeout, interval=0.05, max_interval=1.0
+    )
+
+
+def _alert_log_poller(node_ids: Iterable[str], severity: str, container_name: str) -> Callable[[], bool]:
+    """One log read per call (see verify_alerts_in_logs); True once every node_id was seen."""
+    pattern = _alert_pattern(severity)
+    pending = set(node_ids)
+    since = [None]
+
+    def _all_seen() -> bool:
+        if not pending:
+            return True
+        window = ["--tail", "200"] if since[0] is None else ["--since", since[0]]
+        if _JQ:
+            filter_cmd = [
+                _JQ, "-rR", "--arg", "sev", severity, "--argjson", "ids", json.dumps(sorted(pending)),
+                _JQ_ALERT_IDS
+            ]
+        else:
+            filter_cmd = ["grep", "-F", *(arg for node_id in pending for arg in ("-e", f'"{node_id}"'))]
+        started = f"{time.time():.6f}"
         try:
-            res = subprocess.run(cmd, capture_output=True, text=True)
-            if f'"node_id": "{node_id}"' in res.stdout and f'"severity": "{severity}"' in res.stdout:
-                return True
-        except Exception:
-            pass
-        time.sleep(2)
-    return False
+            logs = subprocess.Popen(
+                ["docker", "logs", *window, container_name],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+            )
+            matched = subprocess.run(
+                filter_cmd,
+                stdin=logs.stdout, capture_output=True, text=True
+            )
+            logs.stdout.close()
+            if logs.wait() != 0:
+                _check_container(container_name)
+                return False
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            return False
+        # Start the next window where this read began: overlapping lines are harmless
+        since[0] = started
+        found = matched.stdout.splitlines() if _JQ else pattern.findall(matched.stdout)
+        pending.difference_update(found)
+        return not pending
+
+    return _all_seen
+
+
+def _db_exists_once(node_id: str) -> bool:
+    """Single EXISTS check for node_id (pooled connection, psql in DB_CONTAINER as fallback)."""
+    def _exists_now(conn) -> bool:
+        with conn.cursor() as cur:
+            _execute_prepared(cur, "record_exists", node_id)
+            return cur.fetchone()[0]
+
+    return _db_check(node_id, _exists_now)
+
+
+def wait_for_ingestion(
+    node_id: str,
+    severity: str = "warning",
+    container_name: str = "dev-fiber-etl-1",
+    timeout: float = 15.0
+) -> bool:
+    """
+    Wait until node_id's metric is in the DB and its alert is in the ETL logs.
+
+    Both checks share one backoff schedule and deadline; each stops being polled once it
+    has passed, and the call returns as soon as both have.
+    """
+    db_seen = [False]
+    logs_seen = _alert_log_poller([node_id], severity, container_name)
+
+    def _ingested() -> bool:
+        if not db_seen[0]:
+            db_seen[0] = _db_exists_once(node_id)
+        return logs_seen() and db_seen[0]
+
+    return wait_until(_ingested, timeout=timeout, interval=0.05, max_interval=1.0)
+
+
+async def verify_db_record_exists_async(node_id: str, timeout: float = 10.0) -> bool:
+    """
+    verify_db_record_exists in a worker thread; gather several to wait on many nodes at once.
+
+    Each waiter holds a pooled connection while listening, so at most 8 wait concurrently;
+    the rest retry with backoff until a connection frees up.
+    """
+    return await asyncio.to_thread(verify_db_record_exists, node_id, timeout)
 
 
-def get_redis_key(key: str, container_name: str = "dev-fiber-redis-1") -> Optional[str]:
-    """Get a key from Redis."""
-    cmd = ["docker", "exec", container_name, "redis-cli", "GET", key]
+async def verify_db_records_exist_async(node_ids: Iterable[str], timeout: float = 10.0) -> bool:
+    """verify_db_records_exist in a worker thread, so it can be gathered with other checks."""
+    return await asyncio.to_thread(verify_db_records_exist, list(node_ids), timeout)
+
+
+async def verify_alerts_in_logs_async(
+    node_ids: Iterable[str],
+    severity: str = "warning",
+    container_name: str = "dev-fiber-etl-1",
+    timeout: float = 10.0
+) -> bool:
+    """verify_alerts_in_logs in a worker thread, so it can be gathered with other checks."""
+    return await asyncio.to_thread(verify_alerts_in_logs, list(node_ids), severity, container_name, timeout)
+
+
+def get_redis_key(key: str, container_name: str = REDIS_CONTAINER) -> Optional[str]:
+    """Get a key from Redis (pooled client on REDIS_URL; redis-cli in the container as fallback)."""
+    return get_redis_keys([key], container_name)[key]
+
+
+def get_redis_keys(keys: Iterable[str], container_name: str = REDIS_CONTAINER) -> Dict[str, Optional[str]]:
+    """Get several keys in one MGET round trip; missing keys map to None."""
+    keys = list(keys)
+    if not keys:
+        return {}
     try:
-        res = subprocess.run(cmd, capture_output=True, text=True)
-        return res.stdout.strip() if res.returncode == 0 else None
-    except Exception:
-        return None
+        return dict(zip(keys, _redis().mget(keys)))
+    except redis.ConnectionError:
+        # Port/socket not mapped: fall back to the container's redis-cli
+        if not REDIS_EXEC_FALLBACK:
+            return dict.fromkeys(keys)
+    except Exception as e:
+        if not _is_transient(e):
+            raise
+        return dict.fromkeys(keys)
+    try:
+        rc, out = _channel(container_name).run("redis-cli MGET " + " ".join(shlex.quote(k) for k in keys))
+    except Exception as e:
+        if not _is_transient(e):
+            raise
+        return dict.fromkeys(keys)
+    if rc != 0:
+        return dict.fromkeys(keys)
+    # Non-tty redis-cli prints one value per line, an empty line for nil
+    values = out.split("\n")[:len(keys)]
+    return {k: (values[i] or None) if i < len(values) else None for i, k in enumerate(keys)}
@@ -1,16 +1,60 @@
+import asyncio
 import httpx
+import orjson
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 class GrafanaClient:
+    """
+    Grafana API client holding one keep-alive connection pool.
+
+    Create it once and reuse it (see the module-scoped `grafana_client` fixture); use
+    `async with GrafanaClient(...)` or call `aclose()` when done. HTTP/2 is negotiated over
+    TLS, so against an https Grafana concurrent queries multiplex on one connection.
+    """
+
     def __init__(self, url, auth=("admin", "admin")):
         self.url = url
         self.auth = auth
+        self._client = httpx.AsyncClient(
+            auth=auth,
+            base_url=url,
+            timeout=10.0,
+            # Transport-level retries cover failed connection attempts only
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            )
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
 
     async def get_firing_alerts(self):
-        async with httpx.AsyncClient(auth=self.auth) as client:
-            response = await client.get(f"{self.url}/api/alertmanager/grafana/config/api/v1/alerts")
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get("/api/alertmanager/grafana/config/api/v1/alerts")
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def query_dashboard_data(self, query):
-        # Implementation for direct datasource queries via Grafana proxy
-        pass
+        """Run one datasource query (POST /api/ds/query) via the Grafana proxy."""
+        return (await self.query_many([query]))[0]
+
+    async def query_many(self, queries):
+        """Run datasource queries concurrently; bodies are serialized once with orjson."""
+        bodies = [orjson.dumps(query) for query in queries]
+        responses = await asyncio.gather(*(
+            self._client.post("/api/ds/query", content=body, headers=_JSON_HEADERS)
+            for body in bodies
+        ))
+        results = []
+        for response in responses:
+            response.raise_for_status()
+            results.append(orjson.loads(response.content))
+        return results
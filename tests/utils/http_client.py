@@ -1,10 +1,32 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class TestHttpClient:
-    """Lightweight test HTTP client wrapper."""
+    """Lightweight test HTTP client wrapper over one pooled keep-alive requests.Session."""
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.1)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def get(self, url):
-        return requests.get(url)
+        return self.session.get(url, timeout=self.timeout)
 
     def post(self, url, json=None):
-        return requests.post(url, json=json)
+        return self.session.post(url, json=json, timeout=self.timeout)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,13 +1,26 @@
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+_BASE = "sandbox/environments"
+_SECTIONS = ("api", "storage", "identity")
 
 class SandboxLoader:
     """Loads sandbox environment configs for test runs."""
 
-    def load(self, env_name: str = "dev"):
-        base = Path("sandbox/environments") / env_name
-        return {
-            "api": base / "api",
-            "storage": base / "storage",
-            "identity": base / "identity",
-        }
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load(env_name: str = "dev"):
+        """Return the env's config paths as strings; cached, read-only mapping per env."""
+        return MappingProxyType({
+            section: f"{_BASE}/{env_name}/{section}" for section in _SECTIONS
+        })
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load_paths(env_name: str = "dev"):
+        """Same as load(), with Path values for callers that need path operations."""
+        return MappingProxyType({
+            section: Path(path) for section, path in SandboxLoader.load(env_name).items()
+        })
@@ -0,0 +1,17 @@
+"""Timestamp helpers for payload builders in hot loops (bursts, Locust)."""
+import time
+
+_TS_CACHE = [0, ""]  # [whole second, "YYYY-MM-DDTHH:MM:SS"]
+
+
+def iso_now() -> str:
+    """UTC ISO-8601 timestamp; the strftime prefix is refreshed once per second.
+
+    Same format as datetime.now(timezone.utc).isoformat(), without the tzinfo round trip.
+    """
+    t = time.time()
+    sec = int(t)
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[0] = sec
+        _TS_CACHE[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+    return f"{_TS_CACHE[1]}.{int((t - sec) * 1e6):06d}+00:00"